@@ -13,28 +13,65 @@ The Deacon is a daemon service responsible for:
 import os
 import sys
 import time
+import copy
 import json
+import queue
+import atexit
+import signal
 import logging
+import logging.handlers
 import schedule
 import threading
-from datetime import datetime
-from typing import Dict, List, Optional, Callable
-import requests
-import docker
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from prometheus_client import start_http_server, Counter, Gauge, Histogram
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('/var/log/deacon/deacon.log')
-    ]
-)
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Callable
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# docker, requests, yaml and prometheus_client are imported on first use to keep
+# startup fast; the API server only needs the standard library.
+if TYPE_CHECKING:
+    import docker
+
+PROCESS_START = time.time()
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
 logger = logging.getLogger('deacon')
 
+class LazyMetric:
+    """Prometheus metric created, and prometheus_client imported, on first use"""
+    
+    registry: List['LazyMetric'] = []
+    _lock = threading.Lock()
+    
+    def __init__(self, kind: str, *args, **kwargs):
+        self.kind = kind
+        self.args = args
+        self.kwargs = kwargs
+        self._metric = None
+        LazyMetric.registry.append(self)
+    
+    def get(self):
+        """Return the underlying metric, creating it if needed"""
+        if self._metric is None:
+            with self._lock:
+                if self._metric is None:
+                    import prometheus_client
+                    self._metric = getattr(prometheus_client, self.kind)(*self.args, **self.kwargs)
+        return self._metric
+    
+    def __getattr__(self, name: str):
+        return getattr(self.get(), name)
+
+def Counter(*args, **kwargs) -> LazyMetric:
+    return LazyMetric('Counter', *args, **kwargs)
+
+def Gauge(*args, **kwargs) -> LazyMetric:
+    return LazyMetric('Gauge', *args, **kwargs)
+
+def Histogram(*args, **kwargs) -> LazyMetric:
+    return LazyMetric('Histogram', *args, **kwargs)
+
 # Prometheus metrics
 PLUGIN_UPDATES_TOTAL = Counter('deacon_plugin_updates_total', 'Total plugin updates', ['status'])
 HEALTH_CHECKS_TOTAL = Counter('deacon_health_checks_total', 'Total health checks', ['service', 'status'])
@@ -42,6 +79,12 @@ BACKUPS_TOTAL = Counter('deacon_backups_total', 'Total backups', ['status'])
 ACTIVE_CONTAINERS = Gauge('deacon_active_containers', 'Number of active OpenClaw containers')
 TELEGRAM_STT_ERRORS = Counter('deacon_telegram_stt_errors_total', 'Telegram STT errors')
 PLUGIN_UPDATE_DURATION = Histogram('deacon_plugin_update_duration_seconds', 'Plugin update duration')
+LOG_RECORDS_DROPPED = Counter('deacon_log_records_dropped_total', 'Log records dropped', ['reason'])
+SKILL_ACTIONS_TOTAL = Counter('deacon_skill_actions_total', 'Skill action executions', ['action', 'status'])
+SKILL_ACTION_DURATION = Histogram('deacon_skill_action_duration_seconds', 'Fleet-wide skill action duration', ['action'])
+DOCKER_CACHE_REQUESTS = Counter('deacon_docker_cache_requests_total', 'Docker inspect/list cache lookups', ['op', 'result'])
+DOCKER_API_LATENCY = Histogram('deacon_docker_api_latency_seconds', 'Docker API call latency', ['op'])
+STARTUP_DURATION = Gauge('deacon_startup_duration_seconds', 'Time from process start to startup phase', ['phase'])
 
 class Config:
     """Deacon configuration"""
@@ -52,6 +95,183 @@ class Config:
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'info')
     API_PORT = int(os.getenv('API_PORT', '8080'))
     METRICS_PORT = int(os.getenv('METRICS_PORT', '9090'))
+    DATA_DIR = os.getenv('DEACON_DATA', '/var/lib/deacon')
+    STATE_FILE = os.getenv('DEACON_STATE_FILE', os.path.join(DATA_DIR, 'state.json'))
+    
+    # Docker API access
+    DOCKER_POOL_SIZE = int(os.getenv('DOCKER_POOL_SIZE', '32'))
+    DOCKER_CACHE_TTL = float(os.getenv('DOCKER_CACHE_TTL', '2'))
+    
+    # Skill actions
+    SKILLS_DIR = os.getenv('SKILLS_DIR', '/opt/deacon/skills')
+    SKILL_ACTION_TIMEOUT = int(os.getenv('SKILL_ACTION_TIMEOUT', '30'))
+    SKILL_MAX_OUTPUT = int(os.getenv('SKILL_MAX_OUTPUT', '65536'))
+    SKILL_MAX_WORKERS = int(os.getenv('SKILL_MAX_WORKERS', '16'))
+    SKILL_MAX_TIMEOUT = int(os.getenv('SKILL_MAX_TIMEOUT', '300'))
+    # Non-streamed exec reads block on the client socket timeout, so it must
+    # outlast the longest skill run plus SkillRunner's 5s grace period
+    DOCKER_TIMEOUT = max(int(os.getenv('DOCKER_TIMEOUT', '60')), SKILL_MAX_TIMEOUT + 10)
+    
+    # Logging pipeline
+    LOG_DIR = os.getenv('LOG_DIR', '/var/log/deacon')
+    LOG_FORMAT = os.getenv('LOG_FORMAT', 'text')  # text | json
+    LOG_ASYNC = os.getenv('LOG_ASYNC', 'true').lower() == 'true'
+    LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', '10000'))
+    LOG_ROTATION = os.getenv('LOG_ROTATION', 'size')  # size | time
+    LOG_MAX_BYTES = int(os.getenv('LOG_MAX_BYTES', str(10 * 1024 * 1024)))
+    LOG_ROTATE_WHEN = os.getenv('LOG_ROTATE_WHEN', 'midnight')
+    LOG_BACKUP_COUNT = int(os.getenv('LOG_BACKUP_COUNT', '7'))
+    LOG_RATE_LIMIT = int(os.getenv('LOG_RATE_LIMIT', '20'))  # identical lines per window, 0 disables
+    LOG_RATE_WINDOW = int(os.getenv('LOG_RATE_WINDOW', '60'))
+    LOG_MAX_OUTPUT = int(os.getenv('LOG_MAX_OUTPUT', '2000'))
+
+class JsonFormatter(logging.Formatter):
+    """Formats log records as single-line JSON objects"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'timestamp': datetime.utcfromtimestamp(record.created).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'message': record.getMessage()
+        }
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            # Already rendered by NonBlockingQueueHandler.prepare in async mode
+            entry['exception'] = record.exc_text
+        return json.dumps(entry)
+
+class RateLimitFilter(logging.Filter):
+    """Suppresses repetitive lines per logger beyond a fixed rate"""
+    
+    MAX_KEYS = 10000
+    
+    def __init__(self, limit: int, window: int):
+        super().__init__()
+        self.limit = limit
+        self.window = window
+        self.lock = threading.Lock()
+        # (logger, level, message) -> [window_start, count]
+        self.seen: Dict[tuple, list] = {}
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        # Shared by several handlers in sync mode; decide once per record
+        decision = getattr(record, 'deacon_rate_ok', None)
+        if decision is not None:
+            return decision
+        record.deacon_rate_ok = self._allow(record)
+        return record.deacon_rate_ok
+    
+    def _allow(self, record: logging.LogRecord) -> bool:
+        key = (record.name, record.levelno, str(record.msg))
+        now = record.created
+        
+        with self.lock:
+            entry = self.seen.get(key)
+            if entry is None or now - entry[0] >= self.window:
+                suppressed = entry[1] - self.limit if entry else 0
+                if len(self.seen) >= self.MAX_KEYS:
+                    self.seen.clear()
+                self.seen[key] = [now, 1]
+            else:
+                entry[1] += 1
+                if entry[1] > self.limit:
+                    LOG_RECORDS_DROPPED.labels(reason='rate_limited').inc()
+                    return False
+                return True
+        
+        if suppressed > 0:
+            record.msg = f"{record.msg} (suppressed {suppressed} repeats in last {self.window}s)"
+        return True
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that drops records instead of blocking when the queue is full"""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge args into the message but keep the traceback in exc_text
+        
+        The stock QueueHandler folds the traceback into the message, which
+        leaves the listener's formatter (e.g. JSON) nothing to render.
+        """
+        record = copy.copy(record)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            # Tracebacks hold frames alive and cannot cross the queue safely
+            record.exc_info = None
+        return record
+    
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_RECORDS_DROPPED.labels(reason='queue_full').inc()
+
+def truncate_output(output, limit: Optional[int] = None) -> str:
+    """Truncate command output before it is logged"""
+    limit = Config.LOG_MAX_OUTPUT if limit is None else limit
+    if isinstance(output, bytes):
+        output = output.decode('utf-8', errors='replace')
+    if limit <= 0 or len(output) <= limit:
+        return output
+    return f"{output[:limit]}... [truncated {len(output) - limit} chars]"
+
+def setup_logging(config: Config) -> Optional[logging.handlers.QueueListener]:
+    """Configure logging handlers, returning the queue listener in async mode"""
+    if config.LOG_FORMAT == 'json':
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(LOG_FORMAT)
+    
+    handlers: List[logging.Handler] = [logging.StreamHandler(sys.stdout)]
+    
+    try:
+        os.makedirs(config.LOG_DIR, exist_ok=True)
+        log_file = os.path.join(config.LOG_DIR, 'deacon.log')
+        if config.LOG_ROTATION == 'time':
+            handlers.append(logging.handlers.TimedRotatingFileHandler(
+                log_file, when=config.LOG_ROTATE_WHEN, backupCount=config.LOG_BACKUP_COUNT
+            ))
+        else:
+            handlers.append(logging.handlers.RotatingFileHandler(
+                log_file, maxBytes=config.LOG_MAX_BYTES, backupCount=config.LOG_BACKUP_COUNT
+            ))
+    except OSError as e:
+        print(f"File logging disabled: {e}", file=sys.stderr)
+    
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, config.LOG_LEVEL.upper(), logging.INFO))
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    
+    listener = None
+    if config.LOG_ASYNC:
+        # Callers only pay for filtering and an enqueue; a listener thread does the I/O
+        queue_handler = NonBlockingQueueHandler(queue.Queue(maxsize=config.LOG_QUEUE_SIZE))
+        listener = logging.handlers.QueueListener(
+            queue_handler.queue, *handlers, respect_handler_level=True
+        )
+        listener.start()
+        atexit.register(listener.stop)
+        handlers = [queue_handler]
+    
+    rate_filter = None
+    if config.LOG_RATE_LIMIT > 0:
+        rate_filter = RateLimitFilter(config.LOG_RATE_LIMIT, config.LOG_RATE_WINDOW)
+    
+    for handler in handlers:
+        if rate_filter:
+            handler.addFilter(rate_filter)
+        root.addHandler(handler)
+    
+    return listener
 
 class AlertManager:
     """Manages alerts and notifications"""
@@ -73,6 +293,8 @@ class AlertManager:
         
         if self.webhook_url:
             try:
+                import requests
+                
                 response = requests.post(
                     self.webhook_url,
                     json=alert,
@@ -85,26 +307,139 @@ class AlertManager:
         else:
             logger.warning(f"ALERT: [{severity}] {title} - {message}")
 
+class CoalescingCache:
+    """Short-TTL cache that merges concurrent identical lookups into one call"""
+    
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.entries: Dict[tuple, tuple] = {}  # key -> (expires_at, value)
+        self.inflight: Dict[tuple, Future] = {}
+        self.stats = {'hit': 0, 'miss': 0, 'coalesced': 0}
+    
+    def get(self, key: tuple, loader: Callable[[], Any]) -> Any:
+        """Return a cached value, joining an in-flight load or running loader"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                result = 'hit'
+            elif key in self.inflight:
+                result = 'coalesced'
+                future = self.inflight[key]
+            else:
+                result = 'miss'
+                future = self.inflight[key] = Future()
+            self.stats[result] += 1
+        DOCKER_CACHE_REQUESTS.labels(op=key[0], result=result).inc()
+        
+        if result == 'hit':
+            return entry[1]
+        if result == 'coalesced':
+            return future.result()
+        
+        try:
+            value = loader()
+        except BaseException as e:
+            # Errors are shared with waiters but never cached
+            with self.lock:
+                del self.inflight[key]
+            future.set_exception(e)
+            raise
+        
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.ttl, value)
+            del self.inflight[key]
+        future.set_result(value)
+        return value
+    
+    def put(self, key: tuple, value: Any):
+        """Store a value fetched as a side effect of another call"""
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.ttl, value)
+    
+    def prune(self):
+        """Drop expired entries, e.g. for containers that no longer exist"""
+        now = time.monotonic()
+        with self.lock:
+            for key in [key for key, entry in self.entries.items() if entry[0] <= now]:
+                del self.entries[key]
+    
+    def hit_rate(self) -> float:
+        total = sum(self.stats.values())
+        return (self.stats['hit'] + self.stats['coalesced']) / total if total else 0.0
+
 class DockerManager:
     """Manages Docker containers and operations"""
     
     def __init__(self):
-        self.client = docker.from_env()
+        self._client = None
+        self._client_lock = threading.Lock()
+        self.cache = CoalescingCache(Config.DOCKER_CACHE_TTL)
+    
+    @property
+    def client(self) -> 'docker.DockerClient':
+        """Docker client, connected on first use"""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    import docker
+                    
+                    # The API handler, scheduler and skill workers share this
+                    # client; size the unix socket pool to match
+                    self._client = docker.from_env(
+                        max_pool_size=Config.DOCKER_POOL_SIZE,
+                        timeout=Config.DOCKER_TIMEOUT
+                    )
+                    logger.info("Connected to Docker daemon")
+        return self._client
+    
+    def _timed(self, op: str, call: Callable[[], Any]) -> Any:
+        start_time = time.time()
+        try:
+            return call()
+        finally:
+            DOCKER_API_LATENCY.labels(op=op).observe(time.time() - start_time)
+    
+    def get_container(self, container_name: str) -> 'docker.models.containers.Container':
+        """Inspect a container, served from the short-TTL cache"""
+        return self.cache.get(
+            ('inspect', container_name),
+            lambda: self._timed('inspect', lambda: self.client.containers.get(container_name))
+        )
+    
+    def _list_containers(self) -> List['docker.models.containers.Container']:
+        containers = self._timed('list', self.client.containers.list)
+        self.cache.prune()
+        # A non-sparse list already inspects every container; reuse those
+        # results so per-container lookups don't inspect them again
+        for container in containers:
+            self.cache.put(('inspect', container.name), container)
+        return containers
     
-    def get_openclaw_containers(self) -> List[docker.models.containers.Container]:
+    def get_openclaw_containers(self) -> List['docker.models.containers.Container']:
         """Get all OpenClaw containers"""
+        all_containers = self.cache.get(('list',), self._list_containers)
         containers = []
-        for container in self.client.containers.list():
+        for container in all_containers:
             if 'openclaw' in container.name.lower():
                 containers.append(container)
         return containers
     
+    def cache_stats(self) -> Dict:
+        """Docker cache counters for the status endpoint"""
+        return dict(self.cache.stats, hit_rate=round(self.cache.hit_rate(), 3))
+    
+    def exec_raw(self, container_name: str, command: List[str]) -> tuple:
+        """Execute command in container, returning raw output and raising on errors"""
+        container = self.get_container(container_name)
+        result = self._timed('exec', lambda: container.exec_run(command))
+        return result.exit_code, result.output
+    
     def exec_in_container(self, container_name: str, command: List[str]) -> tuple:
         """Execute command in container"""
         try:
-            container = self.client.containers.get(container_name)
-            result = container.exec_run(command)
-            return result.exit_code, result.output.decode('utf-8')
+            exit_code, output = self.exec_raw(container_name, command)
+            return exit_code, output.decode('utf-8')
         except Exception as e:
             logger.error(f"Failed to exec in {container_name}: {e}")
             return -1, str(e)
@@ -112,7 +447,7 @@ class DockerManager:
     def get_container_health(self, container_name: str) -> Dict:
         """Get container health status"""
         try:
-            container = self.client.containers.get(container_name)
+            container = self.get_container(container_name)
             return {
                 'name': container.name,
                 'status': container.status,
@@ -154,7 +489,7 @@ class PluginManager:
                 if exit_code == 0:
                     logger.info(f"ClawHub plugins updated in {container.name}")
                 else:
-                    logger.warning(f"ClawHub update output: {output}")
+                    logger.warning(f"ClawHub update output: {truncate_output(output)}")
                 
                 # Update OpenClaw plugins
                 exit_code, output = self.docker.exec_in_container(
@@ -166,7 +501,7 @@ class PluginManager:
                     logger.info(f"OpenClaw plugins updated in {container.name}")
                     success_count += 1
                 else:
-                    logger.error(f"Failed to update OpenClaw plugins in {container.name}: {output}")
+                    logger.error(f"Failed to update OpenClaw plugins in {container.name}: {truncate_output(output)}")
                     fail_count += 1
                     
             except Exception as e:
@@ -286,7 +621,7 @@ class BackupManager:
                     logger.info(f"Backed up skills from {container.name}")
                     success_count += 1
                 else:
-                    logger.error(f"Failed to backup {container.name}: {output}")
+                    logger.error(f"Failed to backup {container.name}: {truncate_output(output)}")
                     fail_count += 1
                     
             except Exception as e:
@@ -319,13 +654,259 @@ class BackupManager:
         except Exception as e:
             logger.error(f"Error cleaning up old backups: {e}")
 
+class SkillError(Exception):
+    """Raised when a skill action cannot be resolved"""
+
+class SkillActionNotRunnable(SkillError):
+    """Raised when an action exists but defines no command to run"""
+
+class SkillIndex:
+    """Validated index of skills/*/skill.yaml, rebuilt when a manifest changes"""
+    
+    def __init__(self, skills_dir: str):
+        self.skills_dir = skills_dir
+        self.lock = threading.Lock()
+        self._mtimes: Dict[str, float] = {}
+        self.skills: Dict[str, Dict] = {}
+        self.errors: Dict[str, str] = {}
+    
+    def _scan(self) -> Dict[str, float]:
+        """Return manifest path -> mtime for every skill directory"""
+        mtimes = {}
+        try:
+            entries = list(os.scandir(self.skills_dir))
+        except OSError:
+            return mtimes
+        for entry in entries:
+            path = os.path.join(entry.path, 'skill.yaml')
+            try:
+                mtimes[path] = os.stat(path).st_mtime
+            except OSError:
+                continue
+        return mtimes
+    
+    @staticmethod
+    def _validate(manifest) -> Dict:
+        """Validate a parsed manifest and normalise its actions"""
+        if not isinstance(manifest, dict):
+            raise ValueError('manifest is not a mapping')
+        if not isinstance(manifest.get('name'), str):
+            raise ValueError("missing 'name'")
+        actions = manifest.get('actions') or []
+        if not isinstance(actions, list):
+            raise ValueError("'actions' is not a list")
+        
+        parsed = {}
+        for action in actions:
+            if not isinstance(action, dict) or not isinstance(action.get('name'), str):
+                raise ValueError(f"invalid action entry: {action!r}")
+            command = action.get('command')
+            if command is not None and not isinstance(command, str):
+                raise ValueError(f"action {action['name']}: 'command' is not a string")
+            parsed[action['name']] = {
+                'description': action.get('description', ''),
+                'command': command,
+                'provider': action.get('provider'),
+                'privileged': bool(action.get('privileged', False))
+            }
+        
+        return {
+            'name': manifest['name'],
+            'version': str(manifest.get('version', '')),
+            'description': manifest.get('description', ''),
+            'actions': parsed
+        }
+    
+    def refresh(self):
+        """Re-parse the index if any manifest was added, removed or modified"""
+        mtimes = self._scan()
+        with self.lock:
+            if mtimes == self._mtimes:
+                return
+            
+            import yaml
+            
+            skills, errors = {}, {}
+            for path in sorted(mtimes):
+                skill_dir = os.path.basename(os.path.dirname(path))
+                try:
+                    with open(path) as f:
+                        skills[skill_dir] = self._validate(yaml.safe_load(f))
+                except (OSError, yaml.YAMLError, ValueError) as e:
+                    errors[skill_dir] = str(e)
+                    logger.warning(f"Invalid skill manifest {path}: {e}")
+            
+            self.skills, self.errors, self._mtimes = skills, errors, mtimes
+            logger.info(f"Indexed {len(skills)} skills from {self.skills_dir}")
+    
+    def summary(self) -> Dict:
+        """Describe indexed skills and their actions"""
+        self.refresh()
+        return {
+            'skills': {
+                skill_dir: {
+                    'name': skill['name'],
+                    'version': skill['version'],
+                    'actions': {
+                        name: {'description': action['description'], 'runnable': action['command'] is not None}
+                        for name, action in skill['actions'].items()
+                    }
+                }
+                for skill_dir, skill in self.skills.items()
+            },
+            'errors': self.errors
+        }
+    
+    def find_action(self, action_name: str, skill: Optional[str] = None) -> tuple:
+        """Resolve an action to (skill directory, action); skill may be a directory or manifest name"""
+        self.refresh()
+        matches = [
+            (skill_dir, data['actions'][action_name])
+            for skill_dir, data in self.skills.items()
+            if action_name in data['actions'] and skill in (None, skill_dir, data['name'])
+        ]
+        if not matches:
+            raise SkillError(f"Unknown action: {action_name}")
+        if len(matches) > 1:
+            raise SkillError(f"Action {action_name} is defined by several skills; specify 'skill'")
+        skill_dir, action = matches[0]
+        if action['command'] is None:
+            raise SkillActionNotRunnable(f"Action {action_name} has no command to run")
+        return skill_dir, action
+
+class SkillRunner:
+    """Runs skill actions across OpenClaw containers in parallel"""
+    
+    # Runs "$3" under coreutils timeout "$1" (exit code 124 on expiry) and
+    # keeps only the first "$2" bytes of its output inside the container.
+    # The rest is drained rather than cut off with SIGPIPE, and fd 3 carries
+    # the command's exit status past the pipeline.
+    EXEC_WRAPPER = (
+        'exec 4>&1; '
+        'status=$( { { timeout "$1" sh -c "$3" 2>&1; echo $? >&3; } '
+        '| { head -c "$2" >&4; cat >/dev/null; }; } 3>&1 ); '
+        'exit "$status"'
+    )
+    
+    def __init__(self, docker_manager: DockerManager, skill_index: SkillIndex, config: Config):
+        self.docker = docker_manager
+        self.index = skill_index
+        self.config = config
+        self.executor = ThreadPoolExecutor(
+            max_workers=config.SKILL_MAX_WORKERS, thread_name_prefix='skill'
+        )
+    
+    def _run_one(self, container_name: str, command: str, timeout: int) -> Dict:
+        start_time = time.time()
+        max_output = self.config.SKILL_MAX_OUTPUT
+        truncated = False
+        try:
+            # One byte over the cap tells us whether the output was cut
+            exit_code, output = self.docker.exec_raw(
+                container_name,
+                ['sh', '-c', self.EXEC_WRAPPER, 'skill', str(timeout), str(max_output + 1), command]
+            )
+            truncated = len(output) > max_output
+            output = output[:max_output].decode('utf-8', errors='replace')
+            if truncated:
+                output += '... [truncated]'
+            if exit_code == 0:
+                status = 'success'
+            elif exit_code == 124:
+                status = 'timeout'
+            else:
+                status = 'failed'
+        except Exception as e:
+            import requests
+            
+            logger.error(f"Failed to exec in {container_name}: {e}")
+            # A client-side read timeout means the command outlived its deadline
+            if isinstance(e, (TimeoutError, requests.exceptions.Timeout)):
+                status = 'timeout'
+            else:
+                status = 'failed'
+            exit_code, output = None, str(e)
+        
+        return {
+            'status': status,
+            'exit_code': exit_code,
+            'output': output,
+            'truncated': truncated,
+            'duration': round(time.time() - start_time, 3)
+        }
+    
+    @staticmethod
+    def _not_run(status: str, reason: str) -> Dict:
+        return {'status': status, 'exit_code': None, 'output': reason, 'truncated': False, 'duration': None}
+    
+    def run_action(self, action_name: str, skill: Optional[str] = None,
+                   containers: Optional[List[str]] = None, timeout: Optional[int] = None) -> Dict:
+        """Run an action on the given (default: all OpenClaw) containers"""
+        skill_dir, action = self.index.find_action(action_name, skill)
+        timeout = timeout or self.config.SKILL_ACTION_TIMEOUT
+        
+        # Only OpenClaw containers are valid targets, whatever the caller asks for
+        known = {container.name: container for container in self.docker.get_openclaw_containers()}
+        results = {}
+        targets = []
+        for name in (known if containers is None else dict.fromkeys(containers)):
+            if name not in known:
+                results[name] = self._not_run('unknown', 'Not an OpenClaw container')
+            elif action['privileged'] and known[name].labels.get('tier') != 'privileged':
+                results[name] = self._not_run('skipped', 'Privileged action on a normal-tier container')
+            else:
+                targets.append(name)
+        
+        start_time = time.time()
+        futures = {
+            name: self.executor.submit(self._run_one, name, action['command'], timeout)
+            for name in targets
+        }
+        
+        deadline = start_time + timeout + 5
+        for name, future in futures.items():
+            try:
+                results[name] = future.result(timeout=max(deadline - time.time(), 0))
+            except Exception as e:
+                if future.cancel():
+                    # Still queued behind other work in the shared pool
+                    results[name] = self._not_run('not_started', 'Deadline passed before a worker was free')
+                elif not future.done():
+                    results[name] = self._not_run('timeout', 'No response before the deadline')
+                else:
+                    results[name] = self._not_run('failed', str(e))
+            SKILL_ACTIONS_TOTAL.labels(action=action_name, status=results[name]['status']).inc()
+        
+        duration = time.time() - start_time
+        SKILL_ACTION_DURATION.labels(action=action_name).observe(duration)
+        
+        summary = dict.fromkeys(
+            ('success', 'failed', 'timeout', 'not_started', 'skipped', 'unknown'), 0
+        )
+        summary['total'] = len(results)
+        for result in results.values():
+            summary[result['status']] += 1
+        
+        logger.info(f"Skill action {skill_dir}/{action_name} ran on {len(results)} containers "
+                    f"in {duration:.2f}s ({summary['success']} ok)")
+        
+        return {
+            'skill': skill_dir,
+            'action': action_name,
+            'duration': round(duration, 3),
+            'summary': summary,
+            'results': results
+        }
+
 class APIHandler(BaseHTTPRequestHandler):
     """HTTP API handler for Deacon"""
     
     deacon_instance = None
     
     def log_message(self, format, *args):
-        logger.info(f"API: {format % args}")
+        # Request lines (including frequent /health probes) are debug-level noise
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"API: {format % args}")
     
     def do_GET(self):
         """Handle GET requests"""
@@ -335,6 +916,8 @@ class APIHandler(BaseHTTPRequestHandler):
             self._send_json(self._get_status())
         elif self.path == '/metrics':
             self._send_prometheus_metrics()
+        elif self.path == '/skills':
+            self._send_json(self.deacon_instance.skill_index.summary())
         else:
             self._send_error(404, 'Not found')
     
@@ -346,9 +929,66 @@ class APIHandler(BaseHTTPRequestHandler):
         elif self.path == '/backup':
             threading.Thread(target=self.deacon_instance.backup_manager.backup_all).start()
             self._send_json({'status': 'backup triggered'})
+        elif self.path == '/skills/run':
+            self._run_skill_action()
         else:
             self._send_error(404, 'Not found')
     
+    def _run_skill_action(self):
+        """Run a skill action across containers and return aggregated results"""
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length) or b'{}')
+            if not isinstance(request, dict):
+                raise ValueError('body must be a JSON object')
+            if not isinstance(request.get('action'), str) or not request['action']:
+                raise ValueError("'action' must be a non-empty string")
+            if request.get('skill') is not None and not isinstance(request['skill'], str):
+                raise ValueError("'skill' must be a string")
+            
+            containers = request.get('containers')
+            if containers is not None and not (
+                isinstance(containers, list) and all(isinstance(name, str) for name in containers)
+            ):
+                raise ValueError("'containers' must be a list of strings")
+            
+            timeout = request.get('timeout')
+            max_timeout = self.deacon_instance.config.SKILL_MAX_TIMEOUT
+            if timeout is not None and (
+                isinstance(timeout, bool) or not isinstance(timeout, int)
+                or not 0 < timeout <= max_timeout
+            ):
+                raise ValueError(f"'timeout' must be an integer between 1 and {max_timeout}")
+        except ValueError as e:
+            self._send_error(400, f"Invalid request: {e}")
+            return
+        
+        try:
+            result = self.deacon_instance.skill_runner.run_action(
+                request['action'],
+                skill=request.get('skill'),
+                containers=containers,
+                timeout=timeout
+            )
+        except SkillActionNotRunnable as e:
+            self._send_error(409, str(e))
+            return
+        except SkillError as e:
+            self._send_error(404, str(e))
+            return
+        except Exception as e:
+            import docker.errors
+            import requests
+            
+            logger.error(f"Skill action {request['action']} failed: {e}")
+            # Docker daemon unreachable or refusing requests
+            if isinstance(e, (docker.errors.DockerException, requests.RequestException, OSError)):
+                self._send_error(503, f"Docker unavailable: {e}")
+            else:
+                self._send_error(500, f"Skill action failed: {e}")
+            return
+        self._send_json(result)
+    
     def _send_json(self, data: Dict):
         """Send JSON response"""
         self.send_response(200)
@@ -370,7 +1010,8 @@ class APIHandler(BaseHTTPRequestHandler):
             'containers': len(self.deacon_instance.docker.get_openclaw_containers()),
             'last_plugin_update': getattr(self.deacon_instance, 'last_plugin_update', None),
             'last_health_check': getattr(self.deacon_instance, 'last_health_check', None),
-            'last_backup': getattr(self.deacon_instance, 'last_backup', None)
+            'last_backup': getattr(self.deacon_instance, 'last_backup', None),
+            'docker_cache': self.deacon_instance.docker.cache_stats()
         }
     
     def _send_prometheus_metrics(self):
@@ -382,6 +1023,36 @@ class APIHandler(BaseHTTPRequestHandler):
         self.end_headers()
         self.wfile.write(generate_latest())
 
+class StateStore:
+    """Persists scheduler state and last-run times across restarts"""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+    
+    def load(self) -> Dict[str, Any]:
+        """Load saved state, returning an empty dict if there is none"""
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable state file {self.path}: {e}")
+            return {}
+    
+    def save(self, state: Dict[str, Any]):
+        """Atomically write state to disk"""
+        with self.lock:
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, 'w') as f:
+                    json.dump(state, f, indent=2)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                logger.error(f"Failed to save state to {self.path}: {e}")
+
 class Deacon:
     """Main Deacon daemon"""
     
@@ -392,29 +1063,85 @@ class Deacon:
         self.plugin_manager = PluginManager(self.docker, self.alerts)
         self.health_checker = HealthChecker(self.docker, self.alerts)
         self.backup_manager = BackupManager(self.docker, self.alerts)
+        self.state_store = StateStore(self.config.STATE_FILE)
+        self.skill_index = SkillIndex(self.config.SKILLS_DIR)
+        self.skill_runner = SkillRunner(self.docker, self.skill_index, self.config)
         
         self.last_plugin_update: Optional[str] = None
         self.last_health_check: Optional[str] = None
         self.last_backup: Optional[str] = None
+        self.jobs: Dict[str, schedule.Job] = {}
         
         self.running = False
     
     def setup_schedules(self):
         """Setup scheduled tasks"""
         # Plugin updates - daily
-        schedule.every(self.config.PLUGIN_UPDATE_INTERVAL).seconds.do(self._run_plugin_update)
+        self.jobs['plugin_update'] = schedule.every(self.config.PLUGIN_UPDATE_INTERVAL).seconds.do(self._run_plugin_update)
         
         # Health checks - every 5 minutes
-        schedule.every(self.config.HEALTH_CHECK_INTERVAL).seconds.do(self._run_health_check)
+        self.jobs['health_check'] = schedule.every(self.config.HEALTH_CHECK_INTERVAL).seconds.do(self._run_health_check)
         
         # Backups - hourly
-        schedule.every(self.config.BACKUP_INTERVAL).seconds.do(self._run_backup)
+        self.jobs['backup'] = schedule.every(self.config.BACKUP_INTERVAL).seconds.do(self._run_backup)
         
         logger.info("Schedules configured:")
         logger.info(f"  - Plugin updates: every {self.config.PLUGIN_UPDATE_INTERVAL}s")
         logger.info(f"  - Health checks: every {self.config.HEALTH_CHECK_INTERVAL}s")
         logger.info(f"  - Backups: every {self.config.BACKUP_INTERVAL}s")
     
+    def restore_state(self):
+        """Restore last-run times and job phases saved by a previous run"""
+        state = self.state_store.load()
+        if not isinstance(state, dict):
+            logger.warning(f"Ignoring malformed state in {self.state_store.path}")
+            state = {}
+        
+        for attr in ('last_plugin_update', 'last_health_check', 'last_backup'):
+            value = state.get(attr)
+            setattr(self, attr, value if isinstance(value, str) else None)
+        
+        next_runs = state.get('next_runs')
+        if not isinstance(next_runs, dict):
+            next_runs = {}
+        
+        for name, job in self.jobs.items():
+            if name in next_runs:
+                try:
+                    # Saved as UTC; schedule works in local time. Clamp in case
+                    # the job is overdue or its interval was shortened.
+                    remaining = (datetime.fromisoformat(next_runs[name]) - datetime.utcnow()).total_seconds()
+                    remaining = min(max(remaining, 0), job.interval)
+                    job.next_run = datetime.now() + timedelta(seconds=remaining)
+                    continue
+                except (TypeError, ValueError) as e:
+                    logger.warning(f"Ignoring saved next run for {name}: {e}")
+            if name == 'health_check':
+                # First boot: check containers straight away
+                job.next_run = datetime.now()
+        
+        if state:
+            logger.info("Restored scheduler state:")
+            for name, job in self.jobs.items():
+                logger.info(f"  - {name}: next run at {job.next_run.isoformat()}")
+    
+    def _state_snapshot(self) -> tuple:
+        return (self.last_plugin_update, self.last_health_check, self.last_backup)
+    
+    def save_state(self):
+        """Persist last-run times and the next run of each job"""
+        now_local = datetime.now()
+        now_utc = datetime.utcnow()
+        self.state_store.save({
+            'last_plugin_update': self.last_plugin_update,
+            'last_health_check': self.last_health_check,
+            'last_backup': self.last_backup,
+            'next_runs': {
+                name: (now_utc + (job.next_run - now_local)).isoformat()
+                for name, job in self.jobs.items() if job.next_run
+            }
+        })
+    
     def _run_plugin_update(self):
         """Run plugin update and record timestamp"""
         self.plugin_manager.update_all_plugins()
@@ -430,10 +1157,15 @@ class Deacon:
         self.backup_manager.backup_all()
         self.last_backup = datetime.utcnow().isoformat()
     
+    def _handle_sigterm(self, signum, frame):
+        """Stop the main loop so shutdown runs normally"""
+        # Only flip the flag: logging here could deadlock on a handler lock
+        self.running = False
+    
     def start_api_server(self):
         """Start HTTP API server"""
         APIHandler.deacon_instance = self
-        server = HTTPServer(('0.0.0.0', self.config.API_PORT), APIHandler)
+        server = ThreadingHTTPServer(('0.0.0.0', self.config.API_PORT), APIHandler)
         
         def run_server():
             logger.info(f"API server started on port {self.config.API_PORT}")
@@ -445,6 +1177,11 @@ class Deacon:
     def start_metrics_server(self):
         """Start Prometheus metrics server"""
         try:
+            from prometheus_client import start_http_server
+            
+            # Register every metric so the first scrape lists them all
+            for metric in LazyMetric.registry:
+                metric.get()
             start_http_server(self.config.METRICS_PORT)
             logger.info(f"Metrics server started on port {self.config.METRICS_PORT}")
         except Exception as e:
@@ -456,30 +1193,47 @@ class Deacon:
         logger.info("Deacon Service Starting")
         logger.info("=" * 50)
         
-        self.setup_schedules()
+        # Serve /health first; everything else can follow
         self.start_api_server()
+        api_ready = time.time() - PROCESS_START
+        
+        self.setup_schedules()
+        self.restore_state()
         self.start_metrics_server()
         
-        # Run initial checks
-        self._run_health_check()
+        STARTUP_DURATION.labels(phase='api_ready').set(api_ready)
+        STARTUP_DURATION.labels(phase='ready').set(time.time() - PROCESS_START)
         
         self.running = True
         
-        logger.info("Deacon is running")
+        # As PID 1 in the container, docker stop only sends SIGTERM; without a
+        # handler Python is killed before state is saved and logs are drained
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self._handle_sigterm)
         
+        logger.info(f"Deacon is running (API ready in {api_ready:.3f}s)")
+        
+        saved = self._state_snapshot()
         try:
             while self.running:
                 schedule.run_pending()
+                if self._state_snapshot() != saved:
+                    saved = self._state_snapshot()
+                    self.save_state()
                 time.sleep(1)
+            logger.info("Shutting down...")
+            self.save_state()
         except KeyboardInterrupt:
             logger.info("Shutting down...")
             self.running = False
+            self.save_state()
         except Exception as e:
             logger.error(f"Unexpected error: {e}")
             raise
 
 def main():
     """Main entry point"""
+    setup_logging(Config())
     deacon = Deacon()
     deacon.run()
 
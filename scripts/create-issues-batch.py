@@ -5,23 +5,34 @@ Creates all 100 improvements as GitHub issues with rate limiting.
 
 Usage:
     export GITHUB_TOKEN="your_token_here"
-    python3 create-issues-batch.py [start_index] [end_index]
+    python3 create-issues-batch.py [start_index] [end_index] [--bulk] [options]
 
 Example:
     python3 create-issues-batch.py 0 20    # Create issues 1-20
     python3 create-issues-batch.py 20 40   # Create issues 21-40
     python3 create-issues-batch.py         # Create all 100 issues
+    python3 create-issues-batch.py --bulk --concurrency 4   # Resumable bulk mode
+
+Bulk mode uses a single pooled HTTP session, paces requests from the GitHub
+rate-limit headers, skips issues whose title already exists in the repo and
+checkpoints the state file after every issue, so an interrupted run can simply
+be re-run. Point GITHUB_API_URL (or --api-base) at a local mock server to test.
 """
 
+import argparse
 import requests
 import json
 import time
 import sys
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 
 GITHUB_TOKEN = os.environ.get("GITHUB_TOKEN", "")
 REPO = "gastown-publish/openclaw-launcher"
-API_BASE = "https://api.github.com"
+API_BASE = os.environ.get("GITHUB_API_URL", "https://api.github.com")
+STATE_FILE = "issue_creation_state.json"
 
 headers = {
     "Authorization": f"token {GITHUB_TOKEN}",
@@ -143,10 +154,8 @@ improvements = [
     ("100", "testing", "Build automated documentation sync from code changes", "Implement automated documentation synchronization triggered by code changes.", "high", "high"),
 ]
 
-def create_issue(number, category, title, description, priority, effort):
-    """Create a GitHub issue via API"""
-    url = f"{API_BASE}/repos/{REPO}/issues"
-    
+def build_issue_payload(number, category, title, description, priority, effort):
+    """Build the GitHub API payload for an improvement"""
     category_labels = {
         "core-runtime": "polecat-1",
         "ui-ux": "polecat-2",
@@ -193,11 +202,16 @@ def create_issue(number, category, title, description, priority, effort):
 *This issue was auto-generated by the Kimi Swarm contribution system.*
 """
     
-    payload = {
+    return {
         "title": f"[IMPROVEMENT] {title} (#{number})",
         "body": body,
         "labels": labels
     }
+
+def create_issue(number, category, title, description, priority, effort):
+    """Create a GitHub issue via API"""
+    url = f"{API_BASE}/repos/{REPO}/issues"
+    payload = build_issue_payload(number, category, title, description, priority, effort)
     
     try:
         response = requests.post(url, headers=headers, json=payload, timeout=30)
@@ -208,17 +222,262 @@ def create_issue(number, category, title, description, priority, effort):
     except Exception as e:
         return False, str(e)
 
+class RateLimiter:
+    """Paces requests from GitHub rate-limit headers, shared by all workers"""
+    
+    def __init__(self, min_interval=1.0, reserve=10):
+        # GitHub asks for at least 1s between content-creating requests
+        self.min_interval = min_interval
+        self.reserve = reserve
+        self.interval = min_interval
+        self.next_slot = 0.0
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+    
+    def acquire(self, write=True):
+        """Block until the next request may be sent"""
+        with self.lock:
+            now = time.time()
+            slot = max(now, self.blocked_until)
+            if write:
+                slot = max(slot, self.next_slot)
+                self.next_slot = slot + self.interval
+        delay = slot - time.time()
+        if delay > 0:
+            time.sleep(delay)
+    
+    def backoff(self, seconds):
+        """Pause every worker for at least the given number of seconds"""
+        with self.lock:
+            self.blocked_until = max(self.blocked_until, time.time() + seconds)
+    
+    def update(self, response):
+        """Adapt pacing to the remaining budget reported by the API"""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                self.backoff(float(retry_after))
+            except ValueError:
+                pass
+        
+        try:
+            remaining = int(response.headers["X-RateLimit-Remaining"])
+            reset = float(response.headers["X-RateLimit-Reset"])
+        except (KeyError, ValueError):
+            return
+        
+        with self.lock:
+            now = time.time()
+            if remaining <= 0:
+                self.blocked_until = max(self.blocked_until, reset + 1)
+                return
+            # Spread what is left of the budget (minus a reserve) over the window
+            budget = max(remaining - self.reserve, 1)
+            self.interval = max(self.min_interval, (reset - now) / budget)
+
+class BulkIssueCreator:
+    """Resumable, concurrent issue creation over a single pooled session"""
+    
+    def __init__(self, api_base, repo, token, state_file=STATE_FILE,
+                 concurrency=4, min_interval=1.0, max_retries=5):
+        self.api_base = api_base.rstrip("/")
+        self.repo = repo
+        self.state_file = state_file
+        self.concurrency = max(1, concurrency)
+        self.max_retries = max_retries
+        self.limiter = RateLimiter(min_interval=min_interval)
+        
+        self.session = requests.Session()
+        self.session.headers.update(headers)
+        self.session.headers["Authorization"] = f"token {token}"
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        self.lock = threading.Lock()
+        self.existing_titles = set()
+        self.state = {"completed": [], "skipped": [], "failed": []}
+    
+    def _request(self, method, url, write=False, **kwargs):
+        """Send a request, honouring primary and secondary rate limits"""
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire(write=write)
+            response = self.session.request(method, url, timeout=30, **kwargs)
+            self.limiter.update(response)
+            
+            if response.status_code not in (403, 429):
+                return response
+            
+            rate_limited = (
+                "Retry-After" in response.headers
+                or response.headers.get("X-RateLimit-Remaining") == "0"
+                or "rate limit" in response.text.lower()
+            )
+            if not rate_limited or attempt == self.max_retries:
+                return response
+            if "Retry-After" not in response.headers and response.headers.get("X-RateLimit-Remaining") != "0":
+                # Secondary limit without a hint: wait at least a minute, growing
+                self.limiter.backoff(60 * (2 ** attempt))
+            self._log(f"⏳ Rate limited, backing off (attempt {attempt + 1}/{self.max_retries})")
+        return response
+    
+    def _log(self, message):
+        with self.lock:
+            print(message, flush=True)
+    
+    def load_state(self):
+        """Load a previous checkpoint so completed issues are not re-created"""
+        if not os.path.exists(self.state_file):
+            return
+        with open(self.state_file) as f:
+            saved = json.load(f)
+        for key in self.state:
+            self.state[key] = [tuple(entry) for entry in saved.get(key, [])]
+        # Failed issues are retried on the next run
+        self.state["failed"] = []
+    
+    def save_state(self):
+        """Atomically checkpoint progress to the state file"""
+        tmp_path = f"{self.state_file}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.state, f, indent=2)
+        os.replace(tmp_path, self.state_file)
+    
+    def load_existing_titles(self):
+        """Index the titles of all issues already in the repo"""
+        url = f"{self.api_base}/repos/{self.repo}/issues"
+        params = {"state": "all", "per_page": 100}
+        while url:
+            response = self._request("GET", url, params=params)
+            response.raise_for_status()
+            for issue in response.json():
+                self.existing_titles.add(issue.get("title", ""))
+            url = response.links.get("next", {}).get("url")
+            params = None
+        return len(self.existing_titles)
+    
+    def _record(self, key, entry):
+        with self.lock:
+            self.state[key].append(entry)
+            self.save_state()
+    
+    def create(self, improvement):
+        """Create a single issue unless it already exists"""
+        number = improvement[0]
+        payload = build_issue_payload(*improvement)
+        
+        with self.lock:
+            if payload["title"] in self.existing_titles:
+                exists = True
+            else:
+                exists = False
+                self.existing_titles.add(payload["title"])
+        if exists:
+            self._record("skipped", (number, "already exists"))
+            self._log(f"⏭️  #{number}: already exists, skipping")
+            return
+        
+        try:
+            response = self._request(
+                "POST", f"{self.api_base}/repos/{self.repo}/issues",
+                write=True, json=payload
+            )
+        except requests.RequestException as e:
+            response, error = None, str(e)
+        
+        if response is not None and response.status_code == 201:
+            issue_number = response.json().get("number")
+            self._record("completed", (number, issue_number))
+            self._log(f"✅ #{number}: created #{issue_number}")
+            return
+        
+        if response is not None:
+            error = f"HTTP {response.status_code}: {response.text}"
+        with self.lock:
+            self.existing_titles.discard(payload["title"])
+        self._record("failed", (number, error))
+        self._log(f"❌ #{number}: {error}")
+    
+    def run(self, batch, start_idx, end_idx):
+        """Create every improvement in the batch with bounded concurrency"""
+        self.load_state()
+        self.state["start_idx"] = start_idx
+        self.state["end_idx"] = end_idx
+        done = {entry[0] for entry in self.state["completed"] + self.state["skipped"]}
+        pending = [improvement for improvement in batch if improvement[0] not in done]
+        
+        print(f"Indexed {self.load_existing_titles()} existing issues")
+        print(f"Creating {len(pending)} GitHub issues "
+              f"({len(batch) - len(pending)} already done, concurrency {self.concurrency})...")
+        print("=" * 70)
+        
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            list(executor.map(self.create, pending))
+        
+        self.save_state()
+        return self.state
+
+def run_bulk(args, batch, start_idx, end_idx):
+    """Bulk mode entry point"""
+    creator = BulkIssueCreator(
+        args.api_base, args.repo, GITHUB_TOKEN,
+        state_file=args.state_file,
+        concurrency=args.concurrency,
+        min_interval=args.min_interval
+    )
+    state = creator.run(batch, start_idx, end_idx)
+    
+    print("\n" + "=" * 70)
+    print("Batch Complete!")
+    print(f"✅ Successfully created: {len(state['completed'])}")
+    print(f"⏭️  Skipped (already exist): {len(state['skipped'])}")
+    print(f"❌ Failed: {len(state['failed'])}")
+    
+    if state["failed"]:
+        print("\nFailed issues (re-run to retry):")
+        for number, error in state["failed"]:
+            print(f"  - #{number}: {error}")
+    
+    print(f"\nState saved to {args.state_file}")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Create improvement issues on GitHub")
+    parser.add_argument("start_idx", nargs="?", type=int, default=0)
+    parser.add_argument("end_idx", nargs="?", type=int, default=len(improvements))
+    parser.add_argument("--bulk", action="store_true",
+                        help="resumable concurrent mode with adaptive rate limiting")
+    parser.add_argument("--concurrency", type=int, default=4,
+                        help="bulk mode: maximum requests in flight (default: 4)")
+    parser.add_argument("--min-interval", type=float, default=1.0,
+                        help="bulk mode: minimum seconds between issue creations (default: 1.0)")
+    parser.add_argument("--state-file", default=STATE_FILE,
+                        help=f"bulk mode: checkpoint file (default: {STATE_FILE})")
+    parser.add_argument("--api-base", default=API_BASE,
+                        help="GitHub API base URL, e.g. a local mock server")
+    parser.add_argument("--repo", default=REPO, help=f"target repository (default: {REPO})")
+    return parser.parse_args()
+
 def main():
+    args = parse_args()
+    
     if not GITHUB_TOKEN:
         print("Error: GITHUB_TOKEN environment variable not set")
         print("Usage: export GITHUB_TOKEN='your_token_here'")
         sys.exit(1)
     
-    start_idx = int(sys.argv[1]) if len(sys.argv) > 1 else 0
-    end_idx = int(sys.argv[2]) if len(sys.argv) > 2 else len(improvements)
+    start_idx = args.start_idx
+    end_idx = args.end_idx
     
     batch = improvements[start_idx:end_idx]
     
+    if args.bulk:
+        run_bulk(args, batch, start_idx, end_idx)
+        return
+    
+    global API_BASE, REPO
+    API_BASE = args.api_base
+    REPO = args.repo
+    
     print(f"Creating {len(batch)} GitHub issues ({start_idx+1} to {end_idx})...")
     print("=" * 70)
     
@@ -260,7 +519,7 @@ def main():
             print(f"  - #{number}: {error}")
     
     # Save state
-    with open("issue_creation_state.json", "w") as f:
+    with open(args.state_file, "w") as f:
         json.dump({
             "completed": completed,
             "failed": failed,
@@ -268,7 +527,7 @@ def main():
             "end_idx": end_idx
         }, f, indent=2)
     
-    print(f"\nState saved to issue_creation_state.json")
+    print(f"\nState saved to {args.state_file}")
 
 if __name__ == "__main__":
     main()